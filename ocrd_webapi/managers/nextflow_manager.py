@@ -1,8 +1,12 @@
+from functools import lru_cache
 from os.path import exists, join
-import shlex
+import asyncio
 import subprocess
-from re import search as regex_search
-from typing import Union
+from re import compile as regex_compile
+from typing import List, Union
+
+# Extracts the version from the output of `nextflow -v`
+NF_VERSION_PATTERN = regex_compile(r"nextflow version\s*([\d.]+)")
 
 
 # Must be further refined
@@ -15,7 +19,7 @@ class NextflowManager:
         # but this is the format that the Nextflow Executor expects
 
     @staticmethod
-    def execute_workflow(
+    async def execute_workflow(
             nf_script_path: str,
             workspace_mets_path: str,
             job_dir: str,
@@ -36,21 +40,26 @@ class NextflowManager:
         )
 
         # Throws an exception if not successful
-        return NextflowManager.__start_nf_process(nf_command, job_dir)
+        return await NextflowManager.__start_nf_process(nf_command, job_dir)
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def is_nf_available() -> Union[str, None]:
         # The path to Nextflow must be in $PATH
         # Otherwise, the full path must be provided
 
+        # The result is cached: the Nextflow installation does not change
+        # while the server is running, there is no need to fork
+        # `nextflow -v` and wait for the JVM every time a manager is created
+
         # TODO: May be a good idea to define
         # the path to Nextflow somewhere else
         # (as a config or const parameter)
-        ver_cmd = "nextflow -v"
+        ver_cmd = ["nextflow", "-v"]
 
         try:
             # Raises an exception if the subprocess fails
-            ver_process = subprocess.run(shlex.split(ver_cmd),
+            ver_process = subprocess.run(ver_cmd,
                                          shell=False,
                                          check=True,
                                          stdout=subprocess.PIPE,
@@ -59,8 +68,7 @@ class NextflowManager:
         except Exception:
             return None
 
-        regex_pattern = r"nextflow version\s*([\d.]+)"
-        nf_version = regex_search(regex_pattern, ver_process.stdout).group(1)
+        nf_version = NF_VERSION_PATTERN.search(ver_process.stdout).group(1)
         return nf_version
 
     @staticmethod
@@ -71,26 +79,28 @@ class NextflowManager:
             venv_path: str = None,
             input_group: str = None,
             in_background: bool = True
-    ) -> str:
-        nf_command = "nextflow"
+    ) -> List[str]:
+        # The command is built as an argument list, not as a string,
+        # so it is passed to the subprocess without any shell-like parsing
+        nf_command = ["nextflow"]
         # If set, executes the nf process in the background
         if in_background:
-            nf_command += " -bg"
-        nf_command += f" run {nf_script_path}"
-        nf_command += f" --mets {ws_mets_path}"
+            nf_command.append("-bg")
+        nf_command += ["run", nf_script_path]
+        nf_command += ["--mets", ws_mets_path]
         if ws_path:
-            nf_command += f" --workspace_dir {ws_path}"
+            nf_command += ["--workspace_dir", ws_path]
         # If None, the venv set inside the Nextflow script will be used
         if venv_path:
-            nf_command += f" --venv {venv_path}"
+            nf_command += ["--venv", venv_path]
         # If None, the input_group set inside the Nextflow script will be used
         if input_group:
-            nf_command += f" --input_group {input_group}"
-        nf_command += " -with-report report.html"
+            nf_command += ["--input_group", input_group]
+        nf_command += ["-with-report", "report.html"]
         return nf_command
 
     @staticmethod
-    def __start_nf_process(nf_command: str, job_dir: str):
+    async def __start_nf_process(nf_command: List[str], job_dir: str):
         nf_out = f'{job_dir}/nextflow_out.txt'
         nf_err = f'{job_dir}/nextflow_err.txt'
 
@@ -99,16 +109,16 @@ class NextflowManager:
         try:
             with open(nf_out, 'w+') as nf_out_file:
                 with open(nf_err, 'w+') as nf_err_file:
-                    # TODO: We will need better management of this, blocking is bad
-                    # The parent process blocks till the subprocess returns.
-                    # Raises an exception if the subprocess fails
-                    nf_process = subprocess.run(shlex.split(nf_command),
-                                                shell=False,
-                                                check=True,
-                                                cwd=job_dir,
-                                                stdout=nf_out_file,
-                                                stderr=nf_err_file,
-                                                universal_newlines=True)
+                    # The event loop is not blocked while waiting for the subprocess,
+                    # other requests are served in the meantime
+                    nf_process = await asyncio.create_subprocess_exec(*nf_command,
+                                                                      cwd=job_dir,
+                                                                      stdout=nf_out_file,
+                                                                      stderr=nf_err_file)
+                    await nf_process.wait()
+            # Raises an exception if the subprocess fails
+            if nf_process.returncode:
+                raise subprocess.CalledProcessError(nf_process.returncode, nf_command)
         # More detailed exception catches needed
         # E.g., was the exception due to IOError or subprocess.CalledProcessError
         except Exception as error:
@@ -1,5 +1,5 @@
 from os import listdir, scandir
-from os.path import exists, isdir, join
+from os.path import isdir, join
 from pathlib import Path
 from typing import List, Union, Tuple
 import aiofiles
@@ -9,6 +9,10 @@ import logging
 from ocrd_webapi.constants import BASE_DIR, SERVER_URL
 from ocrd_webapi.utils import generate_id
 
+# Size of the chunks used when receiving uploaded files (1 MiB).
+# Small chunks result in many event loop round-trips and write syscalls
+RECEIVE_CHUNK_SIZE = 1 << 20
+
 
 class ResourceManager:
     # Warning: Don't change the defaults
@@ -38,10 +42,11 @@ class ResourceManager:
         # self._resource_dir = resource_dir
 
         log_msg = f"{self._resource_router}s base directory: {self._resource_dir}"
-        if not exists(self._resource_dir):
-            Path(self._resource_dir).mkdir(parents=True, exist_ok=True)
+        # A single mkdir call, also safe when several workers start at once
+        try:
+            Path(self._resource_dir).mkdir(parents=True)
             self.log.info(f"Created non-existing {log_msg}")
-        else:
+        except FileExistsError:
             self.log.info(f"Using the existing {log_msg}")
 
     def get_all_resources(self, local: bool) -> List[Tuple[str, str]]:
@@ -84,7 +89,8 @@ class ResourceManager:
         identified with `resource_id` or None
         """
         resource_dir = self._to_resource(resource_id, local=True)
-        if exists(resource_dir) and isdir(resource_dir):
+        # isdir is False for non-existing paths, a single stat is enough
+        if isdir(resource_dir):
             return resource_dir
         return None
 
@@ -119,10 +125,9 @@ class ResourceManager:
     def _create_resource_dir(self, resource_id: str) -> Tuple[str, str]:
         if resource_id is None:
             resource_id = generate_id()
+        # The dir is not created here, the callers (create_workflow_space and the
+        # create_workspace_from_* methods) raise for an already existing resource
         resource_dir = self._to_resource(resource_id, local=True)
-        if exists(resource_dir):
-            self.log.error("Cannot create: {resource_id}. Resource already exists!")
-            # TODO: Raise an Exception here
         return resource_id, resource_dir
 
     def _delete_resource_dir(self, resource_id: str) -> Tuple[str, str]:
@@ -136,16 +141,16 @@ class ResourceManager:
     @staticmethod
     async def _receive_resource(file, resource_dest):
         async with aiofiles.open(resource_dest, "wb") as fpt:
-            content = await file.read(1024)
+            content = await file.read(RECEIVE_CHUNK_SIZE)
             while content:
                 await fpt.write(content)
-                content = await file.read(1024)
+                content = await file.read(RECEIVE_CHUNK_SIZE)
 
     @staticmethod
     async def _receive_resource2(file_path, resource_dest):
         with open(file_path, "rb") as fin:
             with open(resource_dest, "wb") as fout:
-                content = fin.read(1024)
+                content = fin.read(RECEIVE_CHUNK_SIZE)
                 while content:
                     fout.write(content)
-                    content = fin.read(1024)
+                    content = fin.read(RECEIVE_CHUNK_SIZE)
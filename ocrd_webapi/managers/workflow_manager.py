@@ -4,11 +4,12 @@ from typing import List, Union, Tuple
 
 from ocrd_webapi import database as db
 from ocrd_webapi.constants import WORKFLOWS_ROUTER
-from ocrd_webapi.exceptions import WorkflowJobException
+from ocrd_webapi.exceptions import WorkflowException, WorkflowJobException
 from ocrd_webapi.managers.nextflow_manager import NextflowManager
 from ocrd_webapi.managers.resource_manager import ResourceManager
 from ocrd_webapi.managers.workspace_manager import WorkspaceManager
 from ocrd_webapi.models.database import WorkflowJobDB
+from ocrd_webapi.models.workflow import WorkflowJobRsrc, WorkflowRsrc
 from ocrd_webapi.utils import generate_id
 
 
@@ -23,11 +24,14 @@ class WorkflowManager(ResourceManager):
         else:
             self.log.error("Detected Nextflow version: unable to detect")
 
-    def get_workflows(self) -> List[Tuple[str, str]]:
+    def get_workflows(self) -> List[WorkflowRsrc]:
         """
-        Get a list of all available workflow urls.
+        Get a list of all available workflows.
         """
-        return self.get_all_resources(local=False)
+        return [
+            WorkflowRsrc.create(workflow_id=wf_id, workflow_url=wf_url)
+            for wf_id, wf_url in self.get_all_resources(local=False)
+        ]
 
     async def create_workflow_space(self, file, uid: str = None) -> Tuple[str, str]:
         """
@@ -36,11 +40,14 @@ class WorkflowManager(ResourceManager):
         Args:
             file: A Nextflow script
             uid (str): The uid is used as workflow_space-directory. If `None`, an uuid is created.
-            If the corresponding dir is already existing, `None` is returned,
+            If the corresponding dir is already existing, a WorkflowException is raised
 
         """
         workflow_id, workflow_dir = self._create_resource_dir(uid)
-        mkdir(workflow_dir)
+        try:
+            mkdir(workflow_dir)
+        except FileExistsError as error:
+            raise WorkflowException(f"Workflow space already exists: {workflow_id}") from error
         nf_script_dest = join(workflow_dir, file.filename)
         await self._receive_resource(file, nf_script_dest)
         await db.save_workflow(
@@ -68,7 +75,7 @@ class WorkflowManager(ResourceManager):
         mkdir(job_dir)
         return job_id, job_dir
 
-    async def start_nf_workflow(self, workflow_id: str, workspace_id: str) -> Union[list, WorkflowJobException]:
+    async def start_nf_workflow(self, workflow_id: str, workspace_id: str) -> WorkflowJobRsrc:
         # The path to the Nextflow script inside workflow_id
         nf_script_path = self.get_resource_file(workflow_id, file_ext='.nf')
         workspace_mets_path = await db.get_workspace_mets_path(workspace_id=workspace_id)
@@ -82,7 +89,7 @@ class WorkflowManager(ResourceManager):
 
         job_id, job_dir = self.create_workflow_execution_space(workflow_id)
         try:
-            NextflowManager.execute_workflow(
+            await NextflowManager.execute_workflow(
                 nf_script_path=nf_script_path,
                 workspace_mets_path=workspace_mets_path,
                 job_dir=job_dir
@@ -98,26 +105,24 @@ class WorkflowManager(ResourceManager):
             self.log.exception(f"Failed to execute workflow: {error}")
             raise WorkflowJobException(f"Failed to execute workflow: {workflow_id}, "f"with workspace: {workspace_id}")
 
-        parameters = [
-            # Workflow Job ID
-            job_id,
-            # Workflow Job URL
-            self.get_resource_job(workflow_id, job_id, local=False),
-            workflow_job_status,
-            # Workflow URL
-            self.get_resource(workflow_id, local=False),
-            # Workspace URL
-            WorkspaceManager.static_get_resource(workspace_id, local=False)
-        ]
-        return parameters
+        return WorkflowJobRsrc.create(
+            job_id=job_id,
+            job_url=self.get_resource_job(workflow_id, job_id, local=False),
+            workflow_id=workflow_id,
+            workflow_url=self.get_resource(workflow_id, local=False),
+            workspace_id=workspace_id,
+            workspace_url=WorkspaceManager.static_get_resource(workspace_id, local=False),
+            job_state=workflow_job_status
+        )
 
     async def get_workflow_job(self, workflow_id: str, job_id: str) -> Union[WorkflowJobDB, None]:
         wf_job_db = await db.get_workflow_job(job_id)
-        job_dir = self.get_resource_job(workflow_id, job_id, local=True)
-        # Check if a nextflow report is available in the job dir
-        if NextflowManager.is_nf_report(job_dir):
-            # If there is a report and the job state is not STOPPED/SUCCESS
-            if wf_job_db.job_state != 'STOPPED' and wf_job_db.job_state != 'SUCCESS':
+        # Jobs in a final state (STOPPED/SUCCESS) do not change anymore,
+        # the job dir is only checked for jobs that may still be running
+        if wf_job_db and wf_job_db.job_state not in ('STOPPED', 'SUCCESS'):
+            job_dir = self.get_resource_job(workflow_id, job_id, local=True)
+            # Check if a nextflow report is available in the job dir
+            if job_dir and NextflowManager.is_nf_report(job_dir):
                 # Set to STOPPED, since it probably failed.
                 await db.set_workflow_job_state(job_id=job_id, job_state='STOPPED')
         return wf_job_db
@@ -1,4 +1,4 @@
-from os.path import join
+from os.path import exists, join
 from os import remove, symlink
 from typing import List, Union, Tuple
 
@@ -30,7 +30,10 @@ class WorkspaceManager(ResourceManager):
 
     async def create_workspace_from_mets_dir(self, mets_dir: str, uid: str = None) -> Tuple[Union[str, None], str]:
         workspace_id, workspace_dir = self._create_resource_dir(uid)
-        symlink(mets_dir, workspace_dir)
+        try:
+            symlink(mets_dir, workspace_dir)
+        except FileExistsError as error:
+            raise WorkspaceException(f"Workspace already exists: {workspace_id}") from error
         workspace_url = self.get_resource(workspace_id, local=False)
         return workspace_url, workspace_id
 
@@ -43,10 +46,13 @@ class WorkspaceManager(ResourceManager):
             file: ocrd-zip of workspace
             file_stream: Whether the received file is UploadFile type
             uid (str): the uid is used as workspace-directory. If `None`, an uuid is created for
-                this. If corresponding dir already existing, None is returned
+                this. If the corresponding dir is already existing, a WorkspaceException is raised
         """
         # TODO: Separate the local storage from DB cases
         workspace_id, workspace_dir = self._create_resource_dir(uid)
+        # spill() would unpack into a subdir of an already existing dir
+        if exists(workspace_dir):
+            raise WorkspaceException(f"Workspace already exists: {workspace_id}")
         # TODO: Get rid of this low level os.path access,
         #  should happen inside the Resource manager
         zip_dest = join(self._resource_dir, workspace_id + ".zip")
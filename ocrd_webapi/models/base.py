@@ -18,6 +18,9 @@ class Resource(BaseModel):
 
     class Config:
         allow_population_by_field_name = True
+        # Nested resources (e.g. the workflow/workspace of a job)
+        # are created right before use, no need to copy them on validation
+        copy_on_model_validation = 'none'
 
 
 class JobState(BaseModel):
@@ -31,9 +34,6 @@ class Job(Resource):
     # description: (str) - inherited from Resource
     job_state: Optional[JobState] = None
 
-    class Config:
-        allow_population_by_field_name = True
-
 
 class ProcessorArgs(BaseModel):
     workspace_id: str = None
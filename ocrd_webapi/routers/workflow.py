@@ -40,12 +40,7 @@ async def list_workflows() -> List[WorkflowRsrc]:
 
     curl http://localhost:8000/workflow/
     """
-    workflows = workflow_manager.get_workflows()
-    response = []
-    for workflow in workflows:
-        wf_id, wf_url = workflow
-        response.append(WorkflowRsrc.create(workflow_id=wf_id, workflow_url=wf_url))
-    return response
+    return workflow_manager.get_workflows()
 
 
 @router.get(f"/{WORKFLOWS_ROUTER}/{{workflow_id}}", response_model=None)
@@ -138,7 +133,7 @@ async def run_workflow(workflow_id: str, workflow_args: WorkflowArgs,
     """
     await user_login(auth)
     try:
-        parameters = await workflow_manager.start_nf_workflow(
+        workflow_job_rsrc = await workflow_manager.start_nf_workflow(
             workflow_id=workflow_id,
             workspace_id=workflow_args.workspace_id
         )
@@ -147,22 +142,7 @@ async def run_workflow(workflow_id: str, workflow_args: WorkflowArgs,
         # TODO: Don't provide the exception message to the outside world
         raise ResponseException(500, {"error": f"internal server error: {e}"})
 
-    # Parse parameters for better readability of the code
-    job_id = parameters[0]
-    job_url = parameters[1]
-    job_status = parameters[2]
-    workflow_url = parameters[3]
-    workspace_url = parameters[4]
-
-    return WorkflowJobRsrc.create(
-        job_id=job_id,
-        job_url=job_url,
-        workflow_id=workflow_id,
-        workflow_url=workflow_url,
-        workspace_id=workflow_args.workspace_id,
-        workspace_url=workspace_url,
-        job_state=job_status
-    )
+    return workflow_job_rsrc
 
 
 @router.post(f"/{WORKFLOWS_ROUTER}", responses={"201": {"model": WorkflowRsrc}})
@@ -1,4 +1,5 @@
-from os.path import join
+from os import walk
+from os.path import join, relpath
 from pathlib import Path
 from typing import Union
 import bagit
@@ -86,8 +87,8 @@ def extract_bag_dest(workspace_db, workspace_dir, bag_dest) -> None:
 def generate_id(file_ext=None):
     # TODO: We should consider using
     #  uuid1 or uuid3 in the future
-    # Generate a random ID (uuid4)
-    generated_id = str(uuid.uuid4())
+    # Generate a random ID (uuid4) as 32 hex digits, without dashes
+    generated_id = uuid.uuid4().hex
     if file_ext:
         generated_id += file_ext
     return generated_id
@@ -125,7 +126,8 @@ def find_upwards(filename, cwd: Path = None) -> Union[Path, None]:
 
 
 # TODO: Provide separate functions for the steps below
-def bagit_from_url(mets_url, mets_basename="mets.xml", dest=None, file_grp=None, ocrd_identifier=None):
+def bagit_from_url(mets_url, mets_basename="mets.xml", dest=None, file_grp=None,
+                   ocrd_identifier=None, compression=zipfile.ZIP_DEFLATED):
     """
     Create OCRD-ZIP from a mets-URL.
 
@@ -139,6 +141,9 @@ def bagit_from_url(mets_url, mets_basename="mets.xml", dest=None, file_grp=None,
         dest: (optional):           parent directory of the mets file and the OCRD-ZIP file
         file_grp (optional):        file groups to download, downloads everything if not set
         ocrd_identifier (optional): Value for key 'Ocrd-Identifier' in bag-info.txt of created bag
+        compression (optional):     zipfile compression method of the OCRD-ZIP, e.g.
+                                    zipfile.ZIP_STORED to skip compressing already
+                                    compressed images
 
     Returns:
         Path of the created zip bag
@@ -166,7 +171,21 @@ def bagit_from_url(mets_url, mets_basename="mets.xml", dest=None, file_grp=None,
         workspace.save_mets()
 
     # The ocrd workspace bagger automatically downloads the files/groups
-    WorkspaceBagger(resolver).bag(workspace, dest=bag_dest, ocrd_identifier=ocrd_identifier)
+    if compression == zipfile.ZIP_DEFLATED:
+        WorkspaceBagger(resolver).bag(workspace, dest=bag_dest, ocrd_identifier=ocrd_identifier)
+    else:
+        # The bagger always deflates, so the bag is created unzipped and zipped here.
+        # Entries are written like shutil.make_archive (used by the bagger) does,
+        # including the directory entries
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            bag_dir = join(tmp_dir, "bag")
+            WorkspaceBagger(resolver).bag(workspace, dest=bag_dir, ocrd_identifier=ocrd_identifier,
+                                          skip_zip=True)
+            with zipfile.ZipFile(bag_dest, "w", compression=compression) as bag_zip:
+                for root, dirs, files in walk(bag_dir):
+                    for name in sorted(dirs) + files:
+                        path = join(root, name)
+                        bag_zip.write(path, arcname=relpath(path, bag_dir))
 
     return bag_dest
 
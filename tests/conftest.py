@@ -7,6 +7,7 @@ from .constants import WORKFLOWS_DIR, WORKSPACES_DIR
 pytest_plugins = [
     "tests.fixtures.fixtures_database",
     "tests.fixtures.fixtures_server",
+    "tests.fixtures.fixtures_utils",
     "tests.fixtures.fixtures_workflow",
     "tests.fixtures.fixtures_workspace",
 ]
@@ -0,0 +1,34 @@
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+from zipfile import ZipFile
+from pytest import fixture
+
+from tests.utils_test import to_asset_path
+
+
+class QuietHTTPRequestHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+# The mets file and the files it references are served from a local
+# HTTP server, the tests do not depend on a remote server being reachable
+@fixture(scope="session", name="mets_url")
+def fixture_mets_url(tmp_path_factory):
+    serve_dir = tmp_path_factory.mktemp("mets_server")
+    # The image of an example workspace is reused as file of all file groups
+    with ZipFile(to_asset_path("example_ws.ocrd.zip")) as ws_zip:
+        (serve_dir / "image.jpg").write_bytes(ws_zip.read("data/OCR-D-IMG/madeUpId-2.jpg"))
+
+    handler = partial(QuietHTTPRequestHandler, directory=str(serve_dir))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server_url = f"http://127.0.0.1:{server.server_port}"
+    mets = Path(to_asset_path("mets_template.xml")).read_text()
+    (serve_dir / "mets.xml").write_text(mets.replace("SERVER_URL", server_url))
+
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield f"{server_url}/mets.xml"
+    server.shutdown()
+    server.server_close()
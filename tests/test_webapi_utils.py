@@ -1,52 +1,64 @@
 import os
-import shutil
+import pytest
+import zipfile
+
+from ocrd import Resolver
+from ocrd_validators.ocrd_zip_validator import OcrdZipValidator
 
 from ocrd_webapi.utils import (
     bagit_from_url
 )
 
-# Bigger mets file producing OCRD-ZIP that is bigger than 16MB (will be useful for DB tests)
-# has only the "DEFAULT" file group
-test_url = "https://content.staatsbibliothek-berlin.de/dc/PPN1027800947.mets.xml"
-# Smaller mets file that has few file groups
-test_url2 = "https://content.staatsbibliothek-berlin.de/dc/PPN1027800947.mets.xml"
-
 
-# Fast and dirty tests - file existence checked, content not checked
-def test_bagit_from_url_default_mets():
-    test_dest_ext = "/tmp/webapi_utils_test1"
-    dest = bagit_from_url(mets_url=test_url,
-                          mets_basename="mets.xml",
+@pytest.mark.parametrize("mets_basename, file_grp, ocrd_identifier, compression", [
+    # default mets basename, default compression used by the ocrd workspace bagger
+    ("mets.xml", "DEFAULT", "test123", zipfile.ZIP_DEFLATED),
+    # different mets basename
+    ("mets_diff.xml", "DEFAULT", "test456", zipfile.ZIP_STORED),
+    # two file groups
+    ("mets.xml", ["DEFAULT", "THUMBS"], "test789", zipfile.ZIP_STORED),
+])
+def test_bagit_from_url(mets_url, tmp_path, mets_basename, file_grp, ocrd_identifier, compression):
+    test_dest_ext = str(tmp_path)
+    dest = bagit_from_url(mets_url=mets_url,
+                          mets_basename=mets_basename,
                           dest=test_dest_ext,
-                          file_grp="DEFAULT",
-                          ocrd_identifier="test123")
-    assert dest == f"{test_dest_ext}/test123.zip"
-    assert os.path.exists(os.path.join(test_dest_ext, 'mets.xml'))
-    assert os.path.exists(os.path.join(test_dest_ext, 'test123.zip'))
-    shutil.rmtree(test_dest_ext)
+                          file_grp=file_grp,
+                          ocrd_identifier=ocrd_identifier,
+                          compression=compression)
+    assert dest == f"{test_dest_ext}/{ocrd_identifier}.zip"
+    # A single directory listing instead of a stat per expected file
+    dest_entries = {entry.name for entry in os.scandir(test_dest_ext)}
+    assert mets_basename in dest_entries
+    assert f"{ocrd_identifier}.zip" in dest_entries
 
+    valid_report = OcrdZipValidator(Resolver(), dest).validate(processes=1)
+    assert valid_report.is_valid, valid_report.to_xml()
+    kept_file_grps = [file_grp] if isinstance(file_grp, str) else file_grp
+    with zipfile.ZipFile(dest) as bag_zip:
+        names = bag_zip.namelist()
+        # Directory entries are always stored, only the files are compressed
+        file_infos = [info for info in bag_zip.infolist() if not info.is_dir()]
+        assert all(info.compress_type == compression for info in file_infos)
+    assert "data/" in names
+    assert "data/mets.xml" in names
+    for file_grp_name in kept_file_grps:
+        assert f"data/{file_grp_name}/" in names
+    # The MAX file group of the test mets is never requested
+    assert "data/MAX/" not in names
 
-def test_bagit_from_url_diff_mets():
-    test_dest_ext = "/tmp/webapi_utils_test2"
-    dest = bagit_from_url(mets_url=test_url2,
-                          mets_basename="mets_diff.xml",
-                          dest=test_dest_ext,
-                          file_grp="DEFAULT",
-                          ocrd_identifier="test456")
-    assert dest == f"{test_dest_ext}/test456.zip"
-    assert os.path.exists(os.path.join(test_dest_ext, 'mets_diff.xml'))
-    assert os.path.exists(os.path.join(test_dest_ext, 'test456.zip'))
-    shutil.rmtree(test_dest_ext)
 
-
-def test_bagit_from_url_two_file_grps():
-    test_dest_ext = "/tmp/webapi_utils_test3"
-    dest = bagit_from_url(mets_url=test_url2,
-                          mets_basename="mets.xml",
-                          dest=test_dest_ext,
-                          file_grp=["DEFAULT", "THUMBS"],
-                          ocrd_identifier="test789")
-    assert dest == f"{test_dest_ext}/test789.zip"
-    assert os.path.exists(os.path.join(test_dest_ext, 'mets.xml'))
-    assert os.path.exists(os.path.join(test_dest_ext, 'test789.zip'))
-    shutil.rmtree(test_dest_ext)
+def test_bagit_from_url_stored_like_bagger(mets_url, tmp_path):
+    """
+    the zip written for other compressions has the same entries as the one of the ocrd bagger
+    """
+    bags = {}
+    for compression in (zipfile.ZIP_DEFLATED, zipfile.ZIP_STORED):
+        dest = bagit_from_url(mets_url=mets_url,
+                              dest=str(tmp_path / str(compression)),
+                              file_grp=["DEFAULT", "THUMBS"],
+                              ocrd_identifier="test-compare",
+                              compression=compression)
+        with zipfile.ZipFile(dest) as bag_zip:
+            bags[compression] = sorted(bag_zip.namelist())
+    assert bags[zipfile.ZIP_STORED] == bags[zipfile.ZIP_DEFLATED]